@@ -1,3 +1,4 @@
+import threading
 from typing import Dict, Type, List
 from superagi.agents.aria_agents.base_aria_agent import BaseAriaAgent
 from superagi.agents.aria_agents.aria_utility_agent.aria_utility_agent import AriaUtilityAgent
@@ -25,21 +26,25 @@ class AriaAgentRegistry:
     }
 
     _capability_map: Dict[str, List[str]] = {}
+    _initialized: bool = False
+    _init_lock = threading.Lock()
 
     @classmethod
     def register_agent(cls, agent_class: Type[BaseAriaAgent]):
         """Register a new Aria agent"""
         agent_type = agent_class.__name__
-        cls._agents[agent_type] = agent_class
 
         # Create temporary instance to get capabilities
         temp_instance = agent_class(None, 0, {})
         capabilities = temp_instance.get_capabilities()
 
-        for capability in capabilities:
-            if capability not in cls._capability_map:
-                cls._capability_map[capability] = []
-            cls._capability_map[capability].append(agent_type)
+        with cls._init_lock:
+            cls._agents[agent_type] = agent_class
+            for capability in capabilities:
+                if capability not in cls._capability_map:
+                    cls._capability_map[capability] = []
+                if agent_type not in cls._capability_map[capability]:
+                    cls._capability_map[capability].append(agent_type)
 
         logger.info(f"Registered Aria agent: {agent_type} with capabilities: {capabilities}")
 
@@ -51,6 +56,7 @@ class AriaAgentRegistry:
     @classmethod
     def get_agents_by_capability(cls, capability: str) -> List[Type[BaseAriaAgent]]:
         """Get all agents that handle a specific capability"""
+        cls._ensure_initialized()
         agent_types = cls._capability_map.get(capability, [])
         return [cls._agents[agent_type] for agent_type in agent_types if agent_type in cls._agents]
 
@@ -62,8 +68,18 @@ class AriaAgentRegistry:
     @classmethod
     def get_all_capabilities(cls) -> List[str]:
         """Get all available capabilities"""
+        cls._ensure_initialized()
         return list(cls._capability_map.keys())
 
+    @classmethod
+    def _ensure_initialized(cls):
+        """Build the capability map on first use"""
+        if cls._initialized:
+            return
+        with cls._init_lock:
+            if not cls._initialized:
+                cls.initialize_registry()
+
     @classmethod
     def initialize_registry(cls):
         """Initialize the registry with all agents"""
@@ -80,5 +96,4 @@ class AriaAgentRegistry:
             except Exception as e:
                 logger.error(f"Error initializing agent {agent_class.__name__}: {str(e)}")
 
-# Initialize the registry
-AriaAgentRegistry.initialize_registry()
\ No newline at end of file
+        cls._initialized = True
@@ -4,11 +4,16 @@ AriaMemoryAgent - Advanced memory management system for comprehensive data handl
 
 import time
 import json
+from collections import deque
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
 from superagi.agents.aria_agents.base_aria_agent import BaseAriaAgent
 from superagi.lib.logger import logger
 
+# Keywords used by respond() to pick a memory operation
+STORE_KEYWORDS = ('store',)
+SEARCH_KEYWORDS = ('retrieve', 'remember', 'search')
+
 class AriaMemoryAgent(BaseAriaAgent):
     """
     AriaMemoryAgent handles comprehensive memory management including:
@@ -22,13 +27,20 @@ class AriaMemoryAgent(BaseAriaAgent):
     def __init__(self, llm, agent_id: int, agent_execution_id: int = None):
         super().__init__(llm, agent_id, agent_execution_id)
         self.agent_name = "AriaMemoryAgent"
-        self.short_term_memory = []
+        self.max_short_term_size = 100
+        self.short_term_memory = deque(maxlen=self.max_short_term_size)
         self.long_term_memory = {}
         self.memory_index = {}
         self.memory_priorities = {}
-        self.max_short_term_size = 100
         self.max_long_term_size = 1000
         self.compression_threshold = 0.8
+        self.task_handlers = {
+            'store_memory': self._store_memory,
+            'retrieve_memory': self._retrieve_memory,
+            'search_memory': self._search_memory,
+            'compress_memory': self._compress_memory,
+            'cleanup_memory': self._cleanup_memory
+        }
 
     def get_capabilities(self) -> List[str]:
         """
@@ -85,19 +97,8 @@ class AriaMemoryAgent(BaseAriaAgent):
                 task_dict.update(config)
             
             task_type = task_dict.get('type', 'general_memory')
-
-            if task_type == 'store_memory':
-                return self._store_memory(task_dict)
-            elif task_type == 'retrieve_memory':
-                return self._retrieve_memory(task_dict)
-            elif task_type == 'search_memory':
-                return self._search_memory(task_dict)
-            elif task_type == 'compress_memory':
-                return self._compress_memory(task_dict)
-            elif task_type == 'cleanup_memory':
-                return self._cleanup_memory(task_dict)
-            else:
-                return self._general_memory_task(task_dict)
+            handler = self.task_handlers.get(task_type, self._general_memory_task)
+            return handler(task_dict)
 
         except Exception as e:
             logger.error(f"AriaMemoryAgent execution error: {str(e)}")
@@ -113,14 +114,15 @@ class AriaMemoryAgent(BaseAriaAgent):
             data = task.get('data', {})
             memory_type = task.get('memory_type', 'short_term')
             priority = task.get('priority', 0.5)
+            timestamp = datetime.now().isoformat()
 
             memory_entry = {
                 'id': f"mem_{int(time.time() * 1000)}",
                 'data': data,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'priority': priority,
                 'access_count': 0,
-                'last_accessed': datetime.now().isoformat()
+                'last_accessed': timestamp
             }
 
             if memory_type == 'short_term':
@@ -135,7 +137,7 @@ class AriaMemoryAgent(BaseAriaAgent):
                 "message": "Memory stored successfully",
                 "memory_id": memory_entry['id'],
                 "memory_type": memory_type,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
 
         except Exception as e:
@@ -293,10 +295,11 @@ class AriaMemoryAgent(BaseAriaAgent):
             removed_count = 0
 
             # Clean short-term memory
-            self.short_term_memory = [
-                entry for entry in self.short_term_memory
-                if not self._should_remove_entry(entry, cutoff_date, min_access_count)
-            ]
+            self.short_term_memory = deque(
+                (entry for entry in self.short_term_memory
+                 if not self._should_remove_entry(entry, cutoff_date, min_access_count)),
+                maxlen=self.max_short_term_size
+            )
 
             # Clean long-term memory
             to_remove = []
@@ -358,10 +361,7 @@ class AriaMemoryAgent(BaseAriaAgent):
 
     def _add_to_short_term(self, entry: Dict[str, Any]):
         """Add entry to short-term memory"""
-        if len(self.short_term_memory) >= self.max_short_term_size:
-            # Remove oldest entry
-            self.short_term_memory.pop(0)
-
+        # Bounded deque drops the oldest entry once full
         self.short_term_memory.append(entry)
 
     def _add_to_long_term(self, entry: Dict[str, Any]):
@@ -451,7 +451,8 @@ class AriaMemoryAgent(BaseAriaAgent):
 
         # Move entries from short-term to long-term (in reverse order to maintain indices)
         for i in reversed(to_move):
-            entry = self.short_term_memory.pop(i)
+            entry = self.short_term_memory[i]
+            del self.short_term_memory[i]
             self._add_to_long_term(entry)
 
     def get_memory_stats(self) -> Dict[str, Any]:
@@ -475,14 +476,12 @@ class AriaMemoryAgent(BaseAriaAgent):
         try:
             # Parse message to determine memory operation
             task = {'type': 'general_memory', 'data': message, 'context': context or {}}
+            message_lower = message.lower()
             
-            if 'store' in message.lower():
+            if any(keyword in message_lower for keyword in STORE_KEYWORDS):
                 task['type'] = 'store_memory'
                 task['data'] = {'content': message}
-            elif 'retrieve' in message.lower() or 'remember' in message.lower():
-                task['type'] = 'search_memory'
-                task['query'] = message
-            elif 'search' in message.lower():
+            elif any(keyword in message_lower for keyword in SEARCH_KEYWORDS):
                 task['type'] = 'search_memory'
                 task['query'] = message
             
@@ -1,4 +1,5 @@
 
+import re
 import time
 import json
 from typing import List, Dict, Any, Optional
@@ -160,7 +161,6 @@ class AriaUtilityAgent(BaseAriaAgent):
             # Extract specific patterns or substrings
             pattern = context.get('pattern', '')
             if pattern:
-                import re
                 matches = re.findall(pattern, data)
                 return {"matches": matches, "count": len(matches)}
             else: